@@ -0,0 +1,67 @@
+"""Application entry point (run with `python -m fire_and_ice`)"""
+
+import sys
+from fire_and_ice.utils.logger import log
+
+
+def _finish_init(app, splash):
+    """Build and show the main window once the event loop is running."""
+    try:
+        from fire_and_ice.data.oils import init_oils
+        from fire_and_ice.ui.main_window import MainWindow
+
+        # Read the oil tables while the splash is up, before any tab needs them
+        init_oils()
+
+        # Keep a reference on the app so the window isn't garbage collected
+        app.main_window = MainWindow()
+        app.main_window.show()
+        splash.finish(app.main_window)
+    except Exception:
+        # This runs inside the event loop, where the logging excepthook would
+        # swallow the error and leave the splash up with no window; quit instead
+        splash.close()
+        log.exception("Failed to start the application")
+        try:
+            from PyQt6.QtWidgets import QMessageBox
+
+            QMessageBox.critical(
+                None,
+                "Fire & Ice Apothecary",
+                "The application failed to start. See app_debug.log for details.",
+            )
+        except Exception:
+            pass
+        app.exit(1)
+
+
+def main():
+    """Run the application"""
+    # Qt and the UI package are imported here so that importing this module
+    # (or failing before the event loop starts) never pays the PyQt6 load cost.
+    from PyQt6.QtCore import Qt, QTimer
+    from PyQt6.QtGui import QColor, QPixmap
+    from PyQt6.QtWidgets import QApplication, QSplashScreen
+
+    log.info("App starting...")
+    app = QApplication(sys.argv)
+
+    # Paint a splash right away; the heavy UI import and widget-tree
+    # construction happen on the first event loop iteration.
+    pixmap = QPixmap(420, 120)
+    pixmap.fill(QColor("#1e1e1e"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "Loading Fire & Ice Apothecary...",
+        Qt.AlignmentFlag.AlignCenter,
+        QColor("white"),
+    )
+    splash.show()
+    app.processEvents()
+
+    QTimer.singleShot(0, lambda: _finish_init(app, splash))
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""Data package"""
+
+from .oils import get_oil_sap, get_all_oil_names, get_oil_info
+
+__all__ = ["OILS", "get_oil_sap", "get_all_oil_names", "get_oil_info"]
+
+
+def __getattr__(name):
+    # OILS is read lazily by the oils module; don't force it at package import
+    if name == "OILS":
+        from .oils import OILS
+
+        return OILS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
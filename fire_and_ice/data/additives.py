@@ -0,0 +1,211 @@
+"""Additives database used for recipe modifiers"""
+import atexit
+import json
+import os
+import sys
+from types import MappingProxyType
+from typing import Mapping
+
+from ..utils.json_io import (
+    append_journal,
+    compact_journal,
+    journal_path,
+    load_json,
+    replay_journal,
+)
+
+# Built-in additive records live in additives.json next to this module
+ADDITIVES_DATA_FILE = os.path.join(os.path.dirname(__file__), "additives.json")
+
+# Intern names so lookups with UI-supplied (also interned) strings hit the
+# identity fast path in dict probing. Records are read-only views, so callers
+# can share them without copying; edits go through add_additive_entry().
+ADDITIVES = {
+    sys.intern(k): MappingProxyType(v)
+    for k, v in load_json(ADDITIVES_DATA_FILE).items()
+}
+
+FRAGRANCE_OILS = {
+    "Lavender EO": {
+        "description": "Lavender essential oil. Calming floral scent.",
+        "default_percent_of_oils": 3.125
+    }
+}
+
+CUSTOM_ADDITIVES_FILE = "custom_additives.json"
+# Append-only log of edits made since the file was last compacted
+CUSTOM_ADDITIVES_LOG = journal_path(CUSTOM_ADDITIVES_FILE)
+
+# Every additive record carries exactly these fields (with these defaults)
+ADDITIVE_FIELDS = {
+    "description": "",
+    "water_percent_adjust": 0.0,
+    "default_percent_of_oils": 0.0,
+    "is_water_replacement": False,
+}
+
+# Shared result for lookups that miss, so they don't allocate a new dict
+_EMPTY = MappingProxyType({})
+
+# Built-in names are known up front; the cache starts out holding them and
+# is only rebuilt after custom entries change ADDITIVES
+_BUILTIN_NAMES = tuple(sorted(ADDITIVES))
+_SORTED_NAMES_CACHE = _BUILTIN_NAMES
+
+# Names of additives flagged is_water_replacement, rebuilt on demand after
+# ADDITIVES changes
+_WATER_REPLACEMENT_NAMES = None
+
+# In-memory copy of CUSTOM_ADDITIVES_FILE, kept as plain dicts so it can be
+# serialized directly; mutations append to the log, mark it dirty, and
+# save_custom_additives() writes it back in one go
+_CUSTOM_ADDITIVES = {}
+_DIRTY = False
+_LOADED = False
+
+# Set when CUSTOM_ADDITIVES_FILE couldn't be read; compaction is then
+# skipped so the unreadable file and the log are left on disk
+_LOAD_FAILED = False
+
+# Bumped whenever ADDITIVES changes, so callers caching derived results
+# can tell their cache is stale
+_VERSION = 0
+
+
+def get_all_additive_names():
+    """Return the sorted additive names as a read-only tuple."""
+    global _SORTED_NAMES_CACHE
+    _ensure_loaded()
+    if _SORTED_NAMES_CACHE is None:
+        _SORTED_NAMES_CACHE = tuple(sorted(ADDITIVES))
+    return _SORTED_NAMES_CACHE
+
+def get_water_replacement_names() -> frozenset:
+    """Return the names of additives that stand in for part of the water."""
+    global _WATER_REPLACEMENT_NAMES
+    _ensure_loaded()
+    if _WATER_REPLACEMENT_NAMES is None:
+        _WATER_REPLACEMENT_NAMES = frozenset(
+            name for name, info in ADDITIVES.items()
+            if info.get("is_water_replacement", False)
+        )
+    return _WATER_REPLACEMENT_NAMES
+
+
+def data_version() -> int:
+    """Return a counter that changes whenever an additive is added or removed."""
+    return _VERSION
+
+
+def get_all_fragrance_names():
+    return sorted(FRAGRANCE_OILS)
+
+
+def get_additive_info(name: str) -> Mapping:
+    """
+    Return the read-only additive record, or a shared empty mapping.
+
+    Records are stored as MappingProxyType views, so this is a plain lookup;
+    no cache is needed and callers can't modify the shared record.
+    """
+    _ensure_loaded()
+    return ADDITIVES.get(name, _EMPTY)
+
+
+def _normalize_additive(info: dict) -> dict:
+    """Return a record with exactly the ADDITIVE_FIELDS keys, typed consistently."""
+    return {
+        "description": str(info.get("description", "")),
+        "water_percent_adjust": float(info.get("water_percent_adjust", 0.0)),
+        "default_percent_of_oils": float(info.get("default_percent_of_oils", 0.0)),
+        "is_water_replacement": bool(info.get("is_water_replacement", False)),
+    }
+
+
+def add_additive_entry(name: str, info: dict):
+    """Add or update an additive entry in the ADDITIVES DB."""
+    global _SORTED_NAMES_CACHE, _WATER_REPLACEMENT_NAMES, _DIRTY, _VERSION
+    _ensure_loaded()
+    name = sys.intern(name)
+    info = _normalize_additive(info)
+    ADDITIVES[name] = MappingProxyType(info)
+    _SORTED_NAMES_CACHE = None
+    _WATER_REPLACEMENT_NAMES = None
+    _VERSION += 1
+
+    _CUSTOM_ADDITIVES[name] = info
+    _DIRTY = True
+    _append_log("add", name, info)
+
+
+def remove_additive_entry(name: str):
+    global _SORTED_NAMES_CACHE, _WATER_REPLACEMENT_NAMES, _DIRTY, _VERSION
+    _ensure_loaded()
+    if name in ADDITIVES:
+        del ADDITIVES[name]
+        _SORTED_NAMES_CACHE = None
+        _WATER_REPLACEMENT_NAMES = None
+        _VERSION += 1
+
+    if name in _CUSTOM_ADDITIVES:
+        del _CUSTOM_ADDITIVES[name]
+        _DIRTY = True
+        _append_log("remove", name)
+
+
+def _append_log(op: str, name: str, info: dict = None):
+    """Record one change in the append-only log so it survives a crash."""
+    try:
+        append_journal(CUSTOM_ADDITIVES_FILE, op, name, info)
+    except (IOError, OSError) as e:
+        print(f"Error logging custom additive change: {e}")
+
+
+def save_custom_additives():
+    """Compact pending changes into CUSTOM_ADDITIVES_FILE and clear the log."""
+    global _DIRTY
+    if not _DIRTY or _LOAD_FAILED:
+        return
+
+    try:
+        compact_journal(CUSTOM_ADDITIVES_FILE, _CUSTOM_ADDITIVES)
+        _DIRTY = False
+    except (IOError, OSError) as e:
+        print(f"Error saving custom additives: {e}")
+
+
+def _ensure_loaded():
+    """Read custom additives on first use and merge them into ADDITIVES."""
+    global _LOADED, _SORTED_NAMES_CACHE, _WATER_REPLACEMENT_NAMES, _DIRTY, _LOAD_FAILED
+    if _LOADED:
+        return
+    _LOADED = True
+
+    custom_data = {}
+    if os.path.exists(CUSTOM_ADDITIVES_FILE):
+        try:
+            custom_data = load_json(CUSTOM_ADDITIVES_FILE)
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            print(f"Error loading custom additives: {e}")
+            _LOAD_FAILED = True
+
+    # Replay changes logged since the last compaction
+    try:
+        if replay_journal(CUSTOM_ADDITIVES_FILE, custom_data):
+            _DIRTY = True
+    except (IOError, OSError) as e:
+        print(f"Error replaying custom additive log: {e}")
+
+    for name, info in custom_data.items():
+        name = sys.intern(name)
+        info = _normalize_additive(info)
+        _CUSTOM_ADDITIVES[name] = info
+        ADDITIVES[name] = MappingProxyType(info)
+    if custom_data:
+        _SORTED_NAMES_CACHE = None
+        _WATER_REPLACEMENT_NAMES = None
+
+
+# Custom additives are loaded on first access; logged edits are compacted
+# into CUSTOM_ADDITIVES_FILE at exit
+atexit.register(save_custom_additives)
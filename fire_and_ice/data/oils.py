@@ -0,0 +1,645 @@
+"""
+Oil database and calculation logic
+Contains exact SAP values, Fatty Acid profiles, and Quality calculation algorithms.
+"""
+
+import atexit
+import csv
+import functools
+import json
+import os
+import sys
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+from ..utils.json_io import (
+    append_journal,
+    compact_journal,
+    journal_path,
+    load_json,
+    replay_journal,
+)
+
+
+# Fatty acids tracked for every oil, in the order used by profile tuples
+FA_NAMES = (
+    "lauric",
+    "myristic",
+    "palmitic",
+    "stearic",
+    "ricinoleic",
+    "oleic",
+    "linoleic",
+    "linolenic",
+)
+
+
+# Quality keys, in the order _qualities_from_tuple builds them
+QUALITY_NAMES = ("hardness", "cleansing", "bubbly", "creamy", "conditioning")
+
+
+@functools.lru_cache(maxsize=None)
+def _qualities_from_tuple(fa: tuple) -> Mapping:
+    """
+    Derive qualities from a profile given as a tuple in FA_NAMES order.
+
+    Many oils share a profile, so results are cached and shared as a
+    read-only view.
+    """
+    lauric, myristic, palmitic, stearic, ricinoleic, oleic, linoleic, linolenic = fa
+
+    # Hardness = Lauric + Myristic + Palmitic + Stearic
+    # Cleansing = Lauric + Myristic
+    # Bubbly = Lauric + Myristic + Ricinoleic
+    # Creamy = Palmitic + Stearic + Ricinoleic
+    # Conditioning = Ricinoleic + Oleic + Linoleic + Linolenic
+
+    return MappingProxyType({
+        "hardness": lauric + myristic + palmitic + stearic,
+        "cleansing": lauric + myristic,
+        "bubbly": lauric + myristic + ricinoleic,
+        "creamy": palmitic + stearic + ricinoleic,
+        "conditioning": ricinoleic + oleic + linoleic + linolenic,
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def _fa_dict(fa: tuple) -> Mapping:
+    """
+    Expand a profile tuple into the {fatty acid: percent} mapping stored on records.
+
+    Identical profiles share one read-only view.
+    """
+    return MappingProxyType(dict(zip(FA_NAMES, fa)))
+
+
+# SoapCalc exceptions: oils whose published qualities are used as-is instead
+# of being derived from their fatty-acid profile
+_OVERRIDES = {
+    "Abyssinian Oil": {
+        "hardness": 6,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 80,
+        "conditioning": 94,
+    },  # Exception ID 145
+    "Beeswax": {
+        "hardness": 90,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 50,
+        "conditioning": 50,
+    },  # Exception ID 5
+    "Broccoli Seed Oil, Brassica Oleracea": {
+        "hardness": 7,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 6,
+        "conditioning": 93,
+    },  # Exception ID 138
+    "Candelilla Wax": {
+        "hardness": 68,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 60,
+        "conditioning": 60,
+    },  # Exception ID 142
+    "Coconut Oil, fractionated": {
+        "hardness": 100,
+        "cleansing": 100,
+        "bubbly": 100,
+        "creamy": 0,
+        "conditioning": 0,
+    },  # Exception ID 65
+    "Cupuacu Butter": {
+        "hardness": 54,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 43,
+        "conditioning": 44,
+    },  # Exception ID 101
+    "Japan Wax": {
+        "hardness": 68,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 60,
+        "conditioning": 60,
+    },  # Exception ID 143
+    "Meadowfoam Oil": {
+        "hardness": 2,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 2,
+        "conditioning": 98,
+    },  # Exception ID 31
+    "Pracaxi (Pracachy) Seed Oil - hair conditioner": {
+        "hardness": 6,
+        "cleansing": 2,
+        "bubbly": 2,
+        "creamy": 4,
+        "conditioning": 83,
+    },  # Exception ID 149
+    "Rapeseed Oil, unrefined canola": {
+        "hardness": 5,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 1,
+        "conditioning": 95,
+    },  # Exception ID 40
+    "Salmon Oil": {
+        "hardness": 28,
+        "cleansing": 0,
+        "bubbly": 0,
+        "creamy": 3,
+        "conditioning": 72,
+    },  # Exception ID 140
+}
+
+
+def _quality_override(name: str):
+    """Return the read-only published qualities for name, or None."""
+    override = _OVERRIDES.get(name)
+    return MappingProxyType(override) if override else None
+
+
+# Helper to calculate qualities; returns a fresh dict the caller may keep
+def _calc_qualities(fa):
+    return dict(_qualities_from_tuple(tuple(fa.get(k, 0) for k in FA_NAMES)))
+
+
+# Full Database, stored in oils.csv next to this module as one row per oil:
+# name, SAP values, iodine, INS, then the FA_NAMES profile.
+# SAP values in JS are KOH. NaOH = KOH * (40/56.1), so sap_naoh is only
+# filled in where the published value differs from that (rounded to 3
+# places). Qualities come from _OVERRIDES or are derived from the profile.
+OILS_DATA_FILE = os.path.join(os.path.dirname(__file__), "oils.csv")
+_NAOH_PER_KOH = 40.0 / 56.1
+
+# Record key holding the SAP value for each lye type
+_SAP_KEYS = {"NaOH": "sap_naoh", "KOH": "sap_koh"}
+
+# Read on first access to OILS (see __getattr__ below) so importing this
+# module doesn't pay for parsing the whole table
+_OILS = None
+
+# Read-only view of _OILS handed out as the public OILS
+_OILS_VIEW = None
+
+# Sorted names, rebuilt only after the table changes
+_SORTED_NAMES = None
+
+# Bumped whenever the table changes, so callers caching derived results
+# can tell their cache is stale
+_VERSION = 0
+
+CUSTOM_OILS_FILE = "custom_oils.json"
+
+# Append-only log of edits made since the file was last compacted
+CUSTOM_OILS_LOG = journal_path(CUSTOM_OILS_FILE)
+
+# In-memory copy of CUSTOM_OILS_FILE; edits append to the log and mark it
+# dirty, and save_custom_oils() writes it back in one go (at exit), so a
+# burst of edits costs one rewrite instead of one per edit
+_CUSTOM_OILS = {}
+_DIRTY = False
+
+# Set when CUSTOM_OILS_FILE couldn't be read; compaction is then skipped so
+# the unreadable file and the log are left on disk instead of overwritten
+_LOAD_FAILED = False
+
+# Shared result for lookups that miss, so they don't allocate a new dict
+_EMPTY = MappingProxyType({})
+
+
+def _intern_keys(data: dict) -> dict:
+    """
+    Rebuild a parsed JSON record with interned keys (recursing into dicts).
+
+    Keys from a JSON parse (custom oils) are fresh strings; interning them lets lookups
+    with the same names hit the identity fast path in dict probing.
+    """
+    return {
+        sys.intern(k): _intern_keys(v) if isinstance(v, dict) else v
+        for k, v in data.items()
+    }
+
+
+def _num(text: str):
+    """Parse a numeric CSV cell, keeping whole numbers as ints."""
+    return float(text) if "." in text else int(text)
+
+
+def _oil_from_row(name: str, row: list) -> dict:
+    """Build an oil record from its OILS_DATA_FILE row (name column excluded)."""
+    sap_koh, sap_naoh, iodine, ins = row[:4]
+    fa = tuple(map(_num, row[4:12]))
+
+    sap_koh = float(sap_koh)
+    if sap_naoh:
+        sap_naoh = float(sap_naoh)
+    else:
+        sap_naoh = round(sap_koh * _NAOH_PER_KOH, 3)
+
+    return {
+        "sap_koh": sap_koh,
+        "sap_naoh": sap_naoh,
+        "iodine": _num(iodine),
+        "ins": _num(ins),
+        "fa": _fa_dict(fa),
+        "qualities": _quality_override(name) or _qualities_from_tuple(fa),
+    }
+
+
+class _OilTable(MutableMapping):
+    """
+    Oil records keyed by name.
+
+    Built-in oils are held as raw CSV rows and only turned into records the
+    first time they are looked up, so a session that touches a handful of
+    oils doesn't build all of them. Listing names never builds records.
+    """
+
+    def __init__(self, rows: dict):
+        # name -> raw row (list) until first access, then the record (dict)
+        self._data = rows
+
+    def __getitem__(self, name):
+        value = self._data[name]
+        if type(value) is list:
+            value = self._data[name] = _oil_from_row(name, value)
+        return value
+
+    def __setitem__(self, name, info):
+        self._data[name] = info
+
+    def __delitem__(self, name):
+        del self._data[name]
+
+    def __contains__(self, name):
+        return name in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _load_builtin_oils() -> _OilTable:
+    """Read the built-in oil rows from OILS_DATA_FILE."""
+    with open(OILS_DATA_FILE, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)  # Header
+        return _OilTable({sys.intern(row[0]): row[1:] for row in reader})
+
+
+def _oils() -> _OilTable:
+    """Return the oil table, reading it and the custom oils on first use."""
+    global _OILS
+    if _OILS is None:
+        _OILS = _load_builtin_oils()
+        load_custom_oils()
+    return _OILS
+
+
+def init_oils():
+    """
+    Read the oil table and custom oils now rather than on first use.
+
+    Safe to call more than once; lets the app do the disk reads at a known
+    point during startup.
+    """
+    _oils()
+
+
+def __getattr__(name):
+    # PEP 562: OILS is materialized lazily on first access. It is a read-only
+    # view; custom oils change the table through save/delete_custom_oil().
+    global _OILS_VIEW
+    if name == "OILS":
+        if _OILS_VIEW is None:
+            _OILS_VIEW = MappingProxyType(_oils())
+        return _OILS_VIEW
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _normalize_custom_oil(info: dict) -> dict:
+    """
+    Return a custom oil record carrying every field the calculations read.
+
+    Custom oils come from a user-editable file, so missing numbers are
+    zero-filled and missing qualities derived here, once; lookups can then
+    index records directly.
+    """
+    record = dict(info)
+    for key in ("sap_koh", "sap_naoh", "iodine", "ins"):
+        record.setdefault(key, 0.0)
+    record["fa"] = dict(record.get("fa") or {})
+
+    qualities = record.get("qualities")
+    if not qualities:
+        record["qualities"] = _calc_qualities(record["fa"])
+    elif any(k not in qualities for k in QUALITY_NAMES):
+        record["qualities"] = {k: qualities.get(k, 0) for k in QUALITY_NAMES}
+    else:
+        record["qualities"] = dict(qualities)
+    return record
+
+
+def load_custom_oils():
+    """Load custom oils from JSON file, replaying any logged edits."""
+    global _CUSTOM_OILS, _DIRTY, _LOAD_FAILED
+    custom_oils = {}
+    _LOAD_FAILED = False
+    if os.path.exists(CUSTOM_OILS_FILE):
+        try:
+            custom_oils = load_json(CUSTOM_OILS_FILE)
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            print(f"Error loading custom oils: {e}")
+            _LOAD_FAILED = True
+
+    # Replay changes logged since the last compaction
+    try:
+        if replay_journal(CUSTOM_OILS_FILE, custom_oils):
+            _DIRTY = True
+    except (IOError, OSError) as e:
+        print(f"Error replaying custom oil log: {e}")
+
+    _CUSTOM_OILS = {
+        name: _normalize_custom_oil(info)
+        for name, info in _intern_keys(custom_oils).items()
+        if isinstance(info, dict)
+    }
+    if _CUSTOM_OILS:
+        _oils().update(_CUSTOM_OILS)
+        _clear_caches()
+
+
+def save_custom_oil(name: str, data: dict):
+    """Add or update a custom oil; the file is rewritten at exit."""
+    global _DIRTY
+    # Update in-memory
+    name = sys.intern(name)
+    data = _normalize_custom_oil(data)
+    _oils()[name] = data
+    _clear_caches()
+
+    _CUSTOM_OILS[name] = data
+    _DIRTY = True
+    _append_log("add", name, data)
+
+
+def delete_custom_oil(name: str):
+    """Delete a custom oil."""
+    global _DIRTY
+    oils = _oils()
+    if name in oils:
+        del oils[name]
+        _clear_caches()
+
+    if name in _CUSTOM_OILS:
+        del _CUSTOM_OILS[name]
+        _DIRTY = True
+        _append_log("remove", name)
+
+
+def _append_log(op: str, name: str, info: dict = None):
+    """Record one change in the append-only log so it survives a crash."""
+    try:
+        append_journal(CUSTOM_OILS_FILE, op, name, info)
+    except (IOError, OSError) as e:
+        print(f"Error logging custom oil change: {e}")
+
+
+def save_custom_oils():
+    """Compact pending changes into CUSTOM_OILS_FILE and clear the log."""
+    global _DIRTY
+    if not _DIRTY or _LOAD_FAILED:
+        return
+
+    try:
+        compact_journal(CUSTOM_OILS_FILE, _CUSTOM_OILS)
+        _DIRTY = False
+    except (IOError, OSError) as e:
+        print(f"Error saving custom oils: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def get_oil_sap(oil_name: str, lye_type: str = "NaOH") -> float:
+    """Get SAP value for an oil."""
+    info = _oils().get(oil_name)
+    if info is None:
+        return 0.0
+    key = _SAP_KEYS.get(lye_type) or f"sap_{lye_type.lower()}"
+    return info.get(key, 0.0)
+
+
+def get_all_oil_names() -> tuple:
+    """Get the sorted oil names as a read-only tuple"""
+    global _SORTED_NAMES
+    if _SORTED_NAMES is None:
+        _SORTED_NAMES = tuple(sorted(_oils()))
+    return _SORTED_NAMES
+
+
+@functools.lru_cache(maxsize=None)
+def get_oil_info(oil_name: str) -> Mapping:
+    """Get full information about an oil (a shared read-only empty mapping if unknown)"""
+    return _oils().get(oil_name, _EMPTY)
+
+
+class _QualityRow(NamedTuple):
+    """Per-oil values that SoapMath.calculate_qualities weights and sums"""
+
+    hardness: float
+    cleansing: float
+    bubbly: float
+    creamy: float
+    conditioning: float
+    iodine: float
+    ins: float
+
+
+@functools.lru_cache(maxsize=None)
+def _quality_row(oil_name: str):
+    """Return an oil's qualities, iodine and INS as a _QualityRow (None if unknown)."""
+    oil_data = _oils().get(oil_name)
+    if not oil_data:
+        return None
+
+    # Every record carries these fields (custom oils are normalized on load)
+    q = oil_data["qualities"]
+    return _QualityRow(
+        q["hardness"],
+        q["cleansing"],
+        q["bubbly"],
+        q["creamy"],
+        q["conditioning"],
+        oil_data["iodine"],
+        oil_data["ins"],
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_oil_fa_fractions(oil_name: str):
+    """
+    Return an oil's fatty acids as fractions of 1, in FA_NAMES order.
+
+    Returns None if the oil is unknown. The tuple is memoized per oil so the
+    batch breakdown can weight it without walking the record's "fa" dict.
+    """
+    oil_data = _oils().get(oil_name)
+    if not oil_data:
+        return None
+
+    fa = oil_data["fa"]
+    return tuple(fa.get(k, 0.0) / 100.0 for k in FA_NAMES)
+
+
+def data_version() -> int:
+    """Return a counter that changes whenever the oil table changes."""
+    return _VERSION
+
+
+def _clear_caches():
+    """Drop memoized lookups after the oil table changes."""
+    global _SORTED_NAMES, _VERSION
+    _SORTED_NAMES = None
+    _VERSION += 1
+    get_oil_info.cache_clear()
+    get_oil_sap.cache_clear()
+    _quality_row.cache_clear()
+    get_oil_fa_fractions.cache_clear()
+    _blend_sap.cache_clear()
+    _blend_qualities.cache_clear()
+
+
+def _water_percent_of_oils(total_oil_weight, lye_mass, value):
+    return total_oil_weight * (value / 100.0)
+
+
+def _water_lye_concentration(total_oil_weight, lye_mass, value):
+    # Concentration = Lye / (Lye + Water)
+    # Water = (Lye / Concentration) - Lye
+    if value <= 0:
+        return 0.0
+    return (lye_mass / (value / 100.0)) - lye_mass
+
+
+def _water_lye_ratio(total_oil_weight, lye_mass, value):
+    # Ratio = Water : Lye (e.g. 2:1 means value is 2.0)
+    return lye_mass * value
+
+
+# SoapMath.calculate_water method name -> water amount function
+_WATER_METHODS = {
+    "percent_of_oils": _water_percent_of_oils,
+    "lye_concentration": _water_lye_concentration,
+    "water_lye_ratio": _water_lye_ratio,
+}
+
+
+class SoapMath:
+    """
+    Implements the exact calculation logic
+    """
+
+    @staticmethod
+    def calculate_lye(
+        oils: dict, lye_type: str = "NaOH", koh_purity: float = 1.0
+    ) -> float:
+        """
+        Calculate required lye mass.
+        oils: dict of {oil_name: weight_in_grams}
+        lye_type: "NaOH" or "KOH"
+        koh_purity: 0.90 for 90% KOH, 1.0 for pure.
+        """
+        total_lye = _blend_sap(tuple(oils.items()), lye_type)
+
+        if lye_type == "KOH" and koh_purity < 1.0:
+            total_lye = total_lye / koh_purity
+
+        return total_lye
+
+    @staticmethod
+    def calculate_water(
+        total_oil_weight: float,
+        lye_mass: float,
+        method: str = "percent_of_oils",
+        value: float = 38.0,
+    ) -> float:
+        """
+        Calculate water amount based on method.
+        method: "percent_of_oils", "lye_concentration", "water_lye_ratio"
+        """
+        water_method = _WATER_METHODS.get(method)
+        if water_method is None:
+            return 0.0
+        return water_method(total_oil_weight, lye_mass, value)
+
+    @staticmethod
+    def calculate_qualities(oils: dict, total_weight: float = None) -> dict:
+        """
+        Calculate the final soap qualities (Hardness, Cleansing, etc.)
+        Returns a dict with values scaled to the total batch weight.
+        total_weight: sum of the oil weights, if the caller already has it.
+        """
+        if total_weight is None:
+            total_weight = sum(oils.values())
+        # Copy so callers can't alter the memoized result
+        return dict(_blend_qualities(tuple(oils.items()), total_weight))
+
+
+# Recalculations usually repeat the same recipe (redraws, unrelated setting
+# changes), so blends are memoized on the recipe's (name, weight) items.
+# Item order is kept as given so the float sums match an unmemoized call.
+@functools.lru_cache(maxsize=128)
+def _blend_sap(items: tuple, lye_type: str) -> float:
+    """Sum of weight * SAP over (oil name, weight) items."""
+    total_lye = 0.0
+    for name, weight in items:
+        sap = get_oil_sap(name, lye_type)
+        total_lye += weight * sap
+    return total_lye
+
+
+@functools.lru_cache(maxsize=128)
+def _blend_qualities(items: tuple, total_weight: float) -> dict:
+    """Weighted qualities over (oil name, weight) items; see calculate_qualities."""
+    if total_weight == 0:
+        return {}
+
+    # Accumulate in locals and build the result dict once at the end
+    hardness = cleansing = bubbly = creamy = conditioning = 0.0
+    iodine = ins = 0.0
+
+    for name, weight in items:
+        row = _quality_row(name)
+        if row is None:
+            continue
+
+        ratio = weight / total_weight
+
+        hardness += row.hardness * ratio
+        cleansing += row.cleansing * ratio
+        bubbly += row.bubbly * ratio
+        creamy += row.creamy * ratio
+        conditioning += row.conditioning * ratio
+
+        iodine += row.iodine * ratio
+        ins += row.ins * ratio
+
+    return {
+        "hardness": hardness,
+        "cleansing": cleansing,
+        "bubbly": bubbly,
+        "creamy": creamy,
+        "conditioning": conditioning,
+        "iodine": iodine,
+        "ins": ins,
+    }
+
+
+# Logged custom-oil edits are compacted into CUSTOM_OILS_FILE at exit
+atexit.register(save_custom_oils)
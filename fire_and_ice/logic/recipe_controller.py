@@ -2,10 +2,10 @@ import json
 import os
 from PyQt6.QtWidgets import QInputDialog, QFileDialog, QMessageBox, QTableWidgetItem
 from PyQt6.QtCore import Qt
-from src.models.recipe import Recipe
-from src.utils.logger import log
-from src.utils.logger import log
-from src.utils.html_helper import parse_artisan_html_recipe, extract_extended_notes
+from fire_and_ice.models.recipe import Recipe
+from fire_and_ice.utils.logger import log
+from fire_and_ice.utils.logger import log
+from fire_and_ice.utils.html_helper import parse_artisan_html_recipe, extract_extended_notes
 
 class RecipeController:
     def __init__(self, view, calculator, cost_manager, recipe_manager, batch_manager):
@@ -314,9 +314,11 @@ class RecipeController:
             QMessageBox.warning(self.view, "Stock Warning", f"Low stock on: {', '.join(insufficient)}")
             return
 
-        for name, weight in {**self.calculator.oils, **self.calculator.additives}.items():
-            self.cost_manager.deduct_stock(name, weight)
-        self.cost_manager.deduct_stock(self.calculator.lye_type, lye_w)
+        # One inventory write for the whole batch rather than one per ingredient
+        with self.cost_manager.bulk():
+            for name, weight in {**self.calculator.oils, **self.calculator.additives}.items():
+                self.cost_manager.deduct_stock(name, weight)
+            self.cost_manager.deduct_stock(self.calculator.lye_type, lye_w)
 
         recipe_data = self.calculator.get_recipe_dict()
         recipe_data["name"] = self.view.current_recipe.name or "Unsaved Batch"
@@ -376,7 +378,7 @@ class RecipeController:
             self.view.recipe_tab.recipe_name_label.setText(loaded.name)
             # 1. Update the underlying data
             self.calculator.oils = loaded.oils.copy()
-            self.calculator.additives = data.get("additives", {}).copy()
+            self.calculator.additives = loaded.additives.copy()
             self.refresh_additives_table()
             self.view.current_recipe = loaded
 
@@ -6,36 +6,50 @@ import os
 from datetime import datetime, timedelta
 import uuid
 
+from ..utils.json_io import dump_json, load_json
+
 class BatchManager:
     """Manages production batches and cure dates"""
 
     def __init__(self, filepath="batches.json"):
         self.filepath = filepath
         self.batches = []
+        # batch id -> batch dict (the same objects as in self.batches)
+        self._by_id = {}
         self.load_batches()
 
     def load_batches(self):
         if os.path.exists(self.filepath):
             try:
-                with open(self.filepath, 'r') as f:
-                    self.batches = json.load(f)
+                self.batches = load_json(self.filepath)
             except (json.JSONDecodeError, IOError, OSError) as e:
                 print(f"Error loading batches: {e}")
                 self.batches = []
+        self._index_batches()
+
+    def _index_batches(self):
+        """
+        Rebuild the id lookup from self.batches.
+
+        Batches without an id (e.g. hand-edited entries) are left out; for a
+        duplicated id the first batch in the list wins, as with a list scan.
+        """
+        self._by_id = {}
+        for b in self.batches:
+            batch_id = b.get("id")
+            if batch_id is not None:
+                self._by_id.setdefault(batch_id, b)
+
+    def get_batch(self, batch_id):
+        """Return the batch with the given id, or None."""
+        return self._by_id.get(batch_id)
 
     def save_batches(self):
-        temp_path = f"{self.filepath}.tmp"
+        """Write the batches to disk (compact; the file is machine-read)."""
         try:
-            with open(temp_path, 'w') as f:
-                json.dump(self.batches, f, indent=4)
-            os.replace(temp_path, self.filepath)
+            dump_json(self.filepath, self.batches, pretty=False)
         except (IOError, OSError) as e:
             print(f"Error saving batches: {e}")
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    pass
 
     def create_batch(self, recipe_data, notes=""):
         """Create a new batch entry from a recipe"""
@@ -57,24 +71,26 @@ class BatchManager:
             "notes": notes
         }
         self.batches.insert(0, batch) # Add to top
+        self._by_id[batch["id"]] = batch
         self.save_batches()
         return batch
 
     def delete_batch(self, batch_id):
-        self.batches = [b for b in self.batches if b["id"] != batch_id]
-        self.save_batches()
+        if self._by_id.pop(batch_id, None) is not None:
+            # Filter the list so every batch sharing the id goes, not just
+            # the indexed one
+            self.batches = [b for b in self.batches if b.get("id") != batch_id]
+            self.save_batches()
 
     def update_status(self, batch_id, status):
-        for b in self.batches:
-            if b["id"] == batch_id:
-                b["status"] = status
-                self.save_batches()
-                return
+        batch = self._by_id.get(batch_id)
+        if batch is not None:
+            batch["status"] = status
+            self.save_batches()
 
     def update_notes(self, batch_id, notes):
         """Update notes for a specific batch"""
-        for b in self.batches:
-            if b["id"] == batch_id:
-                b["notes"] = notes
-                self.save_batches()
-                return
\ No newline at end of file
+        batch = self._by_id.get(batch_id)
+        if batch is not None:
+            batch["notes"] = notes
+            self.save_batches()
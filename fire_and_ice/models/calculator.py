@@ -1,12 +1,69 @@
 """Calculation models for soap making"""
 
+import sys
 from typing import Dict, List, Tuple
-from ..data.oils import SoapMath
+from ..data import additives as additives_db
+from ..data import oils as oils_db
+from ..data.additives import get_water_replacement_names
+from ..data.oils import FA_NAMES, SoapMath, get_oil_fa_fractions
+
+# Fatty acids reported by get_batch_properties, in display order
+_FA_KEYS = (
+    "lauric",
+    "myristic",
+    "palmitic",
+    "stearic",
+    "oleic",
+    "linoleic",
+    "linolenic",
+    "ricinoleic",
+)
+
+# Grams in one of each weight unit; unknown units are treated as grams
+_GRAMS_PER_UNIT = {"grams": 1.0, "ounces": 28.3495, "pounds": 453.592}
+
+# Grams -> display unit factors used by get_batch_properties
+_DISPLAY_FACTORS = {"ounces": 0.03527396, "pounds": 0.00220462}
+
+_UNIT_ABBREVIATIONS = {"grams": "g", "ounces": "oz", "pounds": "lb"}
+
+# lye_type -> (SAP column to blend with, KOH purity)
+_LYE_PARAMS = {
+    "NaOH": ("NaOH", 1.0),
+    "KOH": ("KOH", 1.0),
+    "90% KOH": ("KOH", 0.90),
+}
+
+# water_calc_method -> (SoapMath.calculate_water method, attribute holding its value)
+_WATER_METHODS = {
+    "ratio": ("water_lye_ratio", "water_to_lye_ratio"),
+    "percent": ("percent_of_oils", "water_percent"),
+    "concentration": ("lye_concentration", "lye_concentration"),
+}
 
 
 class SoapCalculator:
     """Main calculator for soap recipe calculations"""
 
+    __slots__ = (
+        "oils",
+        "superfat_percent",
+        "water_to_lye_ratio",
+        "lye_type",
+        "total_batch_weight",
+        "unit_system",
+        "water_calc_method",
+        "water_percent",
+        "lye_concentration",
+        "additives",
+        "locked_oils",
+        "recipe_name",  # Only set once a recipe is loaded
+        "_weights_key",
+        "_weights_cache",
+        "_properties_key",
+        "_properties",
+    )
+
     def __init__(self):
         self.oils = {}  # {oil_name: weight_in_grams}
         self.superfat_percent = 5.0  # Default 5% superfat
@@ -21,6 +78,12 @@ class SoapCalculator:
         )
         self.additives = {}  # {name: weight_in_grams or percent_of_oils}
         self.locked_oils = set()
+        # Last (total_oil, lye, water) / get_batch_properties results and the
+        # state each was computed from
+        self._weights_key = None
+        self._weights_cache = None
+        self._properties_key = None
+        self._properties = None
 
 
     def toggle_lock(self, oil_name, is_locked):
@@ -31,6 +94,7 @@ class SoapCalculator:
 
     def add_oil(self, oil_name: str, weight: float):
         """Add or update oil in the recipe"""
+        oil_name = sys.intern(oil_name)
         if weight > 0:
             self.oils[oil_name] = weight
         elif oil_name in self.oils:
@@ -52,14 +116,20 @@ class SoapCalculator:
         Returns:
             Lye weight in grams
         """
-        total_oil = self.get_total_oil_weight()
+        return self._weights()[1]
+
+    def _lye_weight(self, total_oil: float) -> float:
+        """get_lye_weight for an already summed total oil weight"""
         if total_oil == 0:
             return 0.0
 
         # Use SoapMath for exact SoapCalc logic
         # Note: SoapCalc applies superfat as a lye discount
-        koh_purity = 0.90 if self.lye_type == "90% KOH" else 1.0
-        calc_lye_type = "KOH" if "KOH" in self.lye_type else "NaOH"
+        params = _LYE_PARAMS.get(self.lye_type)
+        if params is None:
+            # Unrecognized label (e.g. from an older recipe file)
+            params = ("KOH" if "KOH" in self.lye_type else "NaOH", 1.0)
+        calc_lye_type, koh_purity = params
 
         pure_lye = SoapMath.calculate_lye(self.oils, calc_lye_type, koh_purity)
 
@@ -74,44 +144,31 @@ class SoapCalculator:
         Returns:
             Water weight in grams
         """
-        total_oil = self.get_total_oil_weight()
-        lye_weight = self.get_lye_weight()
+        return self._weights()[2]
 
+    def _water_weight(self, total_oil: float, lye_weight: float) -> float:
+        """get_water_weight for an already computed oil total and lye weight"""
         if lye_weight == 0:
             return 0.0
 
-        # Compute additive-based adjustments (do not mutate state)
-        from ..data.additives import ADDITIVES
-
-        additive_adjust = 0.0
         # Note: SoapCalc logic doesn't typically auto-adjust water for additives in the core math,
         # but we can keep this feature if desired. For strict SoapCalc compliance, we rely on the standard methods.
 
-        method_map = {
-            "ratio": "water_lye_ratio",
-            "percent": "percent_of_oils",
-            "concentration": "lye_concentration",
-        }
-
-        method = method_map.get(self.water_calc_method, "percent_of_oils")
-        value = 0.0
-
-        if method == "water_lye_ratio":
-            value = self.water_to_lye_ratio
-        elif method == "percent_of_oils":
-            value = self.water_percent
-        elif method == "lye_concentration":
-            value = self.lye_concentration
+        method, value_attr = _WATER_METHODS.get(
+            self.water_calc_method, _WATER_METHODS["percent"]
+        )
+        value = getattr(self, value_attr)
 
         water_weight = SoapMath.calculate_water(total_oil, lye_weight, method, value)
 
         # If any additives are marked as water replacements, treat their grams
         # as part of the water (subtract from the computed water total).
         replacement_total = 0.0
-        for name, grams in self.additives.items():
-            info = ADDITIVES.get(name, {})
-            if info.get("is_water_replacement", False):
-                replacement_total += grams
+        if self.additives:
+            replacements = get_water_replacement_names()
+            for name, grams in self.additives.items():
+                if name in replacements:
+                    replacement_total += grams
 
         water_weight = max(0.0, water_weight - replacement_total)
 
@@ -119,6 +176,7 @@ class SoapCalculator:
 
     def add_additive(self, name: str, amount: float):
         """Add or update an additive. Amount stored in grams."""
+        name = sys.intern(name)
         if amount > 0:
             self.additives[name] = amount
         elif name in self.additives:
@@ -128,16 +186,70 @@ class SoapCalculator:
         if name in self.additives:
             del self.additives[name]
 
+    def _recipe_key(self) -> tuple:
+        """
+        Snapshot of everything the gram weights and batch properties depend on
+        (apart from the display unit).
+
+        The UI edits self.oils and self.additives in place as well as through
+        the setters, so staleness is detected by comparing snapshots rather
+        than with a dirty flag the setters would have to maintain.
+        """
+        return (
+            tuple(self.oils.items()),
+            tuple(self.additives.items()),
+            self.superfat_percent,
+            self.lye_type,
+            self.water_calc_method,
+            self.water_to_lye_ratio,
+            self.water_percent,
+            self.lye_concentration,
+            oils_db.data_version(),
+            additives_db.data_version(),
+        )
+
+    def _weights(self, recipe_key: tuple = None) -> Tuple[float, float, float]:
+        """
+        Return (total_oil, lye, water) in grams, cached on the recipe state.
+
+        The oils are summed and the lye blended once; water builds on both.
+        """
+        if recipe_key is None:
+            recipe_key = self._recipe_key()
+        if recipe_key != self._weights_key:
+            total_oil = self.get_total_oil_weight()
+            lye = self._lye_weight(total_oil)
+            water = self._water_weight(total_oil, lye)
+            self._weights_cache = (total_oil, lye, water)
+            self._weights_key = recipe_key
+        return self._weights_cache
+
     def get_batch_properties(self) -> Dict[str, float]:
         """
         Calculate batch properties.
 
+        The result is cached until the recipe, its settings or the oil and
+        additive tables change; callers get their own copy.
+
         Returns:
             Dictionary with various properties
         """
-        total_oil = self.get_total_oil_weight()
-        lye = self.get_lye_weight()
-        water = self.get_water_weight()
+        recipe_key = self._recipe_key()
+        key = (recipe_key, self.unit_system)
+        if key != self._properties_key:
+            self._properties = self._calculate_batch_properties(recipe_key)
+            self._properties_key = key
+
+        props = self._properties
+        return dict(
+            props,
+            fa_breakdown=dict(props["fa_breakdown"]),
+            relative_qualities=dict(props["relative_qualities"]),
+        )
+
+    def _calculate_batch_properties(self, recipe_key: tuple) -> Dict[str, float]:
+        """Compute get_batch_properties for the given recipe state."""
+        total_oil, lye, water = self._weights(recipe_key)
 
         total_weight = total_oil + lye + water
         #Added Additive weight to total batch weight calculation
@@ -145,55 +257,36 @@ class SoapCalculator:
         total_weight = total_oil + lye + water + additive_weight
 
         # Fatty acid breakdown (weighted average)
-        fa_keys = [
-            "lauric",
-            "myristic",
-            "palmitic",
-            "stearic",
-            "oleic",
-            "linoleic",
-            "linolenic",
-            "ricinoleic",
-        ]
-        fa_totals = {k: 0.0 for k in fa_keys}
-        from ..data.oils import OILS
-
+        totals = [0.0] * len(FA_NAMES)
         for oil_name, weight in self.oils.items():
-            info = OILS.get(oil_name, {})
-            fa = info.get("fa", {})
-            for k in fa_keys:
-                fa_val = fa.get(k, 0.0)
-                fa_totals[k] += weight * (fa_val / 100.0)
+            fractions = get_oil_fa_fractions(oil_name)
+            if fractions is None:
+                continue
+            for i, frac in enumerate(fractions):
+                totals[i] += weight * frac
+        fa_totals = dict(zip(FA_NAMES, totals))
 
         fa_percentages = {}
         if total_oil > 0:
-            for k in fa_keys:
+            for k in _FA_KEYS:
                 fa_percentages[k] = round((fa_totals[k] / total_oil) * 100.0, 2)
         else:
-            for k in fa_keys:
+            for k in _FA_KEYS:
                 fa_percentages[k] = 0.0
 
         # Compute SoapCalc qualities
         # Note: Standard soap calculators derive qualities solely from the fatty acid
         # profile of the oils. Superfat (lye discount) affects the actual bar
         # (e.g. more conditioning), but does not change these theoretical profile metrics.
-        qualities = SoapMath.calculate_qualities(self.oils)
-
-        # Define conversion constants
-        GRAMS_TO_OZ = 0.03527396
-        GRAMS_TO_LBS = 0.00220462
-
-        # Check what the current unit system is
-        if self.unit_system == "ounces":
-            total_oil *= GRAMS_TO_OZ
-            lye *= GRAMS_TO_OZ
-            water *= GRAMS_TO_OZ
-            total_weight *= GRAMS_TO_OZ
-        elif self.unit_system == "pounds":
-            total_oil *= GRAMS_TO_LBS
-            lye *= GRAMS_TO_LBS
-            water *= GRAMS_TO_LBS
-            total_weight *= GRAMS_TO_LBS
+        qualities = SoapMath.calculate_qualities(self.oils, total_oil)
+
+        # Convert to the current unit system (grams need no conversion)
+        factor = _DISPLAY_FACTORS.get(self.unit_system)
+        if factor is not None:
+            total_oil *= factor
+            lye *= factor
+            water *= factor
+            total_weight *= factor
 
         return {
             "total_oil_weight": round(total_oil, 2),
@@ -236,7 +329,7 @@ class SoapCalculator:
 
     def set_lye_type(self, lye_type: str):
         """Set lye type ('NaOH', 'KOH', or '90% KOH')"""
-        if lye_type in ["NaOH", "KOH", "90% KOH"]:
+        if lye_type in _LYE_PARAMS:
             self.lye_type = lye_type
 
     def set_unit_system(self, unit: str):
@@ -275,13 +368,7 @@ class SoapCalculator:
         Returns:
             Weight in target unit
         """
-        if to_unit == "grams":
-            return weight_grams
-        elif to_unit == "ounces":
-            return weight_grams / 28.3495
-        elif to_unit == "pounds":
-            return weight_grams / 453.592
-        return weight_grams
+        return weight_grams / _GRAMS_PER_UNIT.get(to_unit, 1.0)
 
     def convert_from_grams(self, weight_grams: float, to_unit: str) -> float:
             """ Alias for convert_weight to keep naming consistent with convert_to_grams """
@@ -298,13 +385,7 @@ class SoapCalculator:
         Returns:
             Weight in grams
         """
-        if from_unit == "grams":
-            return weight
-        elif from_unit == "ounces":
-            return weight * 28.3495
-        elif from_unit == "pounds":
-            return weight * 453.592
-        return weight
+        return weight * _GRAMS_PER_UNIT.get(from_unit, 1.0)
 
     def _calculate_relative_qualities(self, fa_percentages: dict) -> dict:
         """Deprecated: Use _calculate_recipe_qualities instead.
@@ -316,14 +397,9 @@ class SoapCalculator:
         return SoapMath.calculate_qualities(self.oils)
 
     def get_unit_abbreviation(self):
-        mapping = {
-            "grams": "g",
-            "ounces": "oz",
-            "pounds": "lb"
-        }
         # Using .get() ensures that if self.unit_system is "Ounces" (Capitalized)
         # or missing, it defaults to "g" instead of None.
-        return mapping.get(self.unit_system, "g")
+        return _UNIT_ABBREVIATIONS.get(self.unit_system, "g")
 
     def get_recipe_dict(self) -> Dict:
         """Get recipe as dictionary for saving"""
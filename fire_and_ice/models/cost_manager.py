@@ -4,8 +4,26 @@ Manager for ingredient costs and COGS calculations.
 
 import json
 import os
+from contextlib import contextmanager
 from typing import Any, Dict, Optional
 
+from ..utils.json_io import encode_json, load_json, write_atomic
+
+# Grams per unit for every accepted unit spelling; unknown units are
+# treated as grams
+_GRAMS_PER_UNIT = {
+    # Weight units
+    "g": 1.0, "grams": 1.0, "gram": 1.0,
+    "oz": 28.3495, "ounces": 28.3495, "ounce": 28.3495,
+    "lb": 453.592, "lbs": 453.592, "pounds": 453.592, "pound": 453.592,
+    "kg": 1000.0, "kilograms": 1000.0, "kilogram": 1000.0,
+    # Volume units (Approximation: 1g/ml)
+    "ml": 1.0, "milliliters": 1.0,
+    "l": 1000.0, "liters": 1000.0, "liter": 1000.0,
+    "gal": 3785.41, "gallons": 3785.41, "gallon": 3785.41,
+    "fl oz": 29.5735, "fluid ounces": 29.5735,
+}
+
 
 class CostManager:
     """
@@ -14,17 +32,36 @@ class CostManager:
     Data is persisted to a JSON file to track user-specific pricing.
     """
 
+    __slots__ = (
+        "filepath",
+        "costs",
+        "_cost_per_gram",
+        "_saved_payload",
+        "_bulk_depth",
+        "_save_pending",
+    )
+
     def __init__(self, filepath: str = "ingredient_costs.json"):
         self.filepath = filepath
         self.costs: Dict[str, Dict[str, Any]] = {}
+        # name -> cost per gram, dropped whenever costs are loaded or saved
+        self._cost_per_gram: Dict[str, float] = {}
+        # Serialized form of what the file currently holds, so saves that
+        # would write identical contents can be skipped
+        self._saved_payload: Optional[bytes] = None
+        # Saves requested inside bulk() are held back until it exits
+        self._bulk_depth = 0
+        self._save_pending = False
         self.load_costs()
 
     def load_costs(self):
         """Load costs from JSON file."""
+        self._cost_per_gram.clear()
+        self._saved_payload = None
         if os.path.exists(self.filepath):
             try:
-                with open(self.filepath, "r") as f:
-                    self.costs = json.load(f)
+                self.costs = load_json(self.filepath)
+                self._saved_payload = encode_json(self.costs)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error loading costs: {e}")
                 self.costs = {}
@@ -32,13 +69,49 @@ class CostManager:
             self.costs = {}
 
     def save_costs(self):
-        """Save costs to JSON file."""
+        """
+        Save costs to JSON file, or mark them pending inside bulk().
+
+        Every change to self.costs is followed by a call here, so this is
+        also where cached costs per gram are dropped.
+        """
+        self._cost_per_gram.clear()
+        if self._bulk_depth:
+            self._save_pending = True
+            return
+        self._write_costs()
+
+    def _write_costs(self):
+        """Write self.costs unless the file already holds the same data."""
+        self._save_pending = False
+        payload = encode_json(self.costs)
+        if payload == self._saved_payload:
+            return
+
         try:
-            with open(self.filepath, "w") as f:
-                json.dump(self.costs, f, indent=4)
+            write_atomic(self.filepath, payload)
+            self._saved_payload = payload
         except (IOError, OSError) as e:
             print(f"Error saving costs: {e}")
 
+    @contextmanager
+    def bulk(self):
+        """
+        Group several edits into a single save.
+
+        Usage:
+            with cost_manager.bulk():
+                for name, grams in usage.items():
+                    cost_manager.deduct_stock(name, grams)
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self._save_pending:
+                self._write_costs()
+
     def set_cost(self, name: str, price: float, quantity: float, unit: str):
         """
         Set cost for an ingredient.
@@ -87,6 +160,13 @@ class CostManager:
 
     def get_cost_per_gram(self, name: str) -> float:
         """Calculate cost per gram for an ingredient."""
+        cached = self._cost_per_gram.get(name)
+        if cached is None:
+            cached = self._cost_per_gram[name] = self._calculate_cost_per_gram(name)
+        return cached
+
+    def _calculate_cost_per_gram(self, name: str) -> float:
+        """Compute get_cost_per_gram from the stored price and quantity."""
         data = self.costs.get(name)
         if not data:
             return 0.0
@@ -107,29 +187,7 @@ class CostManager:
 
     def _convert_to_grams(self, amount: float, unit: str) -> float:
         """Convert various units to grams."""
-        unit = unit.lower().strip()
-
-        # Weight units
-        if unit in ["g", "grams", "gram"]:
-            return amount
-        if unit in ["oz", "ounces", "ounce"]:
-            return amount * 28.3495
-        if unit in ["lb", "lbs", "pounds", "pound"]:
-            return amount * 453.592
-        if unit in ["kg", "kilograms", "kilogram"]:
-            return amount * 1000.0
-
-        # Volume units (Approximation: 1g/ml)
-        if unit in ["ml", "milliliters"]:
-            return amount
-        if unit in ["l", "liters", "liter"]:
-            return amount * 1000.0
-        if unit in ["gal", "gallons", "gallon"]:
-            return amount * 3785.41
-        if unit in ["fl oz", "fluid ounces"]:
-            return amount * 29.5735
-
-        return amount
+        return amount * _GRAMS_PER_UNIT.get(unit.lower().strip(), 1.0)
 
     def deduct_stock(self, name: str, amount_grams: float) -> float:
         """
@@ -164,29 +222,7 @@ class CostManager:
 
     def _convert_from_grams(self, grams: float, unit: str) -> float:
         """Convert grams to target unit."""
-        unit = unit.lower().strip()
-
-        # Weight units
-        if unit in ["g", "grams", "gram"]:
-            return grams
-        if unit in ["oz", "ounces", "ounce"]:
-            return grams / 28.3495
-        if unit in ["lb", "lbs", "pounds", "pound"]:
-            return grams / 453.592
-        if unit in ["kg", "kilograms", "kilogram"]:
-            return grams / 1000.0
-
-        # Volume units (Approximation: 1g = 1ml)
-        if unit in ["ml", "milliliters"]:
-            return grams
-        if unit in ["l", "liters", "liter"]:
-            return grams / 1000.0
-        if unit in ["gal", "gallons", "gallon"]:
-            return grams / 3785.41
-        if unit in ["fl oz", "fluid ounces"]:
-            return grams / 29.5735
-
-        return grams
+        return grams / _GRAMS_PER_UNIT.get(unit.lower().strip(), 1.0)
 
     def has_sufficient_stock(self, name: str, amount_grams: float) -> bool:
         """Check if there is enough stock for the given amount in grams."""
@@ -1,6 +1,7 @@
 """Recipe data model and management"""
 # imports
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -64,8 +65,10 @@ class Recipe:
         recipe = cls(data.get("name", "Untitled Recipe"))
         recipe.created_date = data.get("created_date", recipe.created_date)
         recipe.modified_date = data.get("modified_date", recipe.modified_date)
-        recipe.oils = data.get("oils", {}).copy()
-        recipe.additives = data.get("additives", {}).copy() # FIXED: Added to load
+        # Intern ingredient names so lookups against the (interned) oil and
+        # additive tables can match by identity
+        recipe.oils = {sys.intern(k): v for k, v in data.get("oils", {}).items()}
+        recipe.additives = {sys.intern(k): v for k, v in data.get("additives", {}).items()} # FIXED: Added to load
         recipe.superfat_percent = data.get("superfat_percent", 5.0)
         recipe.water_to_lye_ratio = data.get("water_to_lye_ratio", 2.0)
         recipe.lye_type = data.get("lye_type", "NaOH")
@@ -1,5 +1,5 @@
 from PyQt6.QtCore import QAbstractTableModel, Qt, QModelIndex
-from src.utils.logger import log
+from fire_and_ice.utils.logger import log
 
 class RecipeTableModel(QAbstractTableModel):
     """Model to handle the oils list in the recipe tab."""
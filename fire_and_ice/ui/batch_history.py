@@ -170,9 +170,7 @@ class BatchHistoryWidget(QWidget):
         lot = self.table.item(row, 1).text()
 
         # Find batch data
-        batch = next(
-            (b for b in self.batch_manager.batches if b["id"] == batch_id), None
-        )
+        batch = self.batch_manager.get_batch(batch_id)
 
         if batch:
             dialog = BatchNotesDialog(
@@ -231,9 +229,7 @@ class BatchHistoryWidget(QWidget):
             return
 
         batch_id = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-        batch = next(
-            (b for b in self.batch_manager.batches if b["id"] == batch_id), None
-        )
+        batch = self.batch_manager.get_batch(batch_id)
 
         if not batch:
             return
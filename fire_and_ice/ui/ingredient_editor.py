@@ -3,8 +3,8 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox, QPushButton, QTabWidget, QWidget, 
     QFormLayout, QMessageBox, QCheckBox, QGroupBox
 )
-from src.data.oils import save_custom_oil, delete_custom_oil, _calc_qualities
-from src.data.additives import add_additive_entry, remove_additive_entry
+from fire_and_ice.data.oils import save_custom_oil, delete_custom_oil, _calc_qualities
+from fire_and_ice.data.additives import add_additive_entry, remove_additive_entry
 
 class IngredientEditorDialog(QDialog):
     def __init__(self, parent=None):
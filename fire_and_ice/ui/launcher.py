@@ -112,7 +112,7 @@ class LauncherWindow(QWidget):
 
     def launch_soap(self):
         # Import locally to avoid circular imports or heavy load at startup
-        from src.ui.main_window import MainWindow
+        from fire_and_ice.ui.main_window import MainWindow
         self.soap_window = MainWindow()
         self.soap_window.show()
         self.close()
@@ -20,16 +20,16 @@ from PyQt6.QtWidgets import (
 
 # 1. Standard Library & Logger
 from matplotlib.table import table
-from src.utils.logger import log
+from fire_and_ice.utils.logger import log
 
 # 2. Models (The Brains)
-from src.models import (
+from fire_and_ice.models import (
     SoapCalculator, Recipe, RecipeManager,
     BatchManager, CostManager, RecipeTableModel
 )
 
 # 3. Logic & Controllers
-from src.logic.recipe_controller import RecipeController
+from fire_and_ice.logic.recipe_controller import RecipeController
 from .views.manager_view import RecipeManagementWidget
 from .theme_manager import ThemeManager
 
@@ -627,7 +627,7 @@ class MainWindow(QMainWindow):
     def remove_selected_additive(self, table: QTableWidget):
         """Remove selected additive"""
         row = table.currentRow()
-        keys = sorted(self.calculator.additives.keys())
+        keys = sorted(self.calculator.additives)
 
         if row >= 0 and row < len(keys):
             name = keys[row]
@@ -636,7 +636,7 @@ class MainWindow(QMainWindow):
 
     def open_ingredient_editor(self):
         """Open the custom ingredient editor dialog"""
-        from src.ui.ingredient_editor import IngredientEditorDialog
+        from fire_and_ice.ui.ingredient_editor import IngredientEditorDialog
 
         dialog = IngredientEditorDialog(self)
         dialog.exec()
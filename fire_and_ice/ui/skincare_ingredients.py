@@ -15,7 +15,7 @@ EXFOLIANTS = {
 
 def get_all_exfoliant_names():
     """Returns a sorted list of all exfoliant names."""
-    return sorted(EXFOLIANTS.keys())
+    return sorted(EXFOLIANTS)
 
 
 def is_exfoliant(name: str) -> bool:
@@ -14,8 +14,8 @@ from PyQt6.QtWidgets import (
     QInputDialog,
 )
 
-from src.models import SoapCalculator as Calculator
-from src.models.cost_manager import CostManager
+from fire_and_ice.models import SoapCalculator as Calculator
+from fire_and_ice.models.cost_manager import CostManager
 class ProfitAnalysisWidget(QWidget):
     """Widget for calculating business profit and pricing"""
 
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (
     QGroupBox,
 )
 from PyQt6.QtCore import Qt
-from src.models import SoapCalculator
+from fire_and_ice.models import SoapCalculator
 
 try:
     from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
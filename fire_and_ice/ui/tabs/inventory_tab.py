@@ -18,8 +18,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtGui import QColor
-from src.data import get_all_oil_names
-from src.data.additives import (
+from fire_and_ice.data import get_all_oil_names
+from fire_and_ice.data.additives import (
     get_all_additive_names,
 )
 
@@ -63,7 +63,7 @@ class InventoryCostWidget(QWidget):
         self.ingredient_combo.setEditable(True)
         # Populate with oils and additives
         items = sorted(
-            get_all_oil_names() + get_all_additive_names() + ["NaOH", "KOH", "90% KOH"]
+            [*get_all_oil_names(), *get_all_additive_names(), "NaOH", "KOH", "90% KOH"]
         )
         self.ingredient_combo.addItems(items)
         completer = QCompleter(items)
@@ -251,7 +251,7 @@ class InventoryCostWidget(QWidget):
         current = self.ingredient_combo.currentText()
         self.ingredient_combo.clear()
         items = sorted(
-            get_all_oil_names() + get_all_additive_names() + ["NaOH", "KOH", "90% KOH"]
+            [*get_all_oil_names(), *get_all_additive_names(), "NaOH", "KOH", "90% KOH"]
         )
         self.ingredient_combo.addItems(items)
         self.ingredient_combo.setCurrentText(current)
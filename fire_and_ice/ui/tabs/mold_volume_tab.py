@@ -18,8 +18,8 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QDoubleSpinBox,
 )
-from src.models import SoapCalculator
-from src.utils.helpers import SelectAllSpinBox
+from fire_and_ice.models import SoapCalculator
+from fire_and_ice.utils.helpers import SelectAllSpinBox
 
 
 class MoldVolumeWidget(QWidget):
@@ -26,12 +26,12 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtWidgets import QHeaderView
 # Data & Logic Imports
-from src.data import get_all_oil_names
-from src.data.additives import get_all_additive_names, get_additive_info, get_all_fragrance_names
-from src.models import SoapCalculator, RecipeTableModel
-from src.logic import RecipeController
-from src.utils.logger import log
-from src.models.cost_manager import CostManager
+from fire_and_ice.data import get_all_oil_names
+from fire_and_ice.data.additives import get_all_additive_names, get_all_fragrance_names
+from fire_and_ice.models import SoapCalculator, RecipeTableModel
+from fire_and_ice.logic import RecipeController
+from fire_and_ice.utils.logger import log
+from fire_and_ice.models.cost_manager import CostManager
 class RecipeTab(QWidget):
     """Main tab for recipe creation and calculations"""
     def __init__(self, calculator, cost_manager, recipe_controller, parent=None):
@@ -382,13 +382,12 @@ class OilInputWidget(QWidget):
         self.oil_combo.clear()
 
         if self.ingredient_names:
-            names = self.ingredient_names[:]
+            names = list(self.ingredient_names)
         else:
-            names = get_all_oil_names()
+            names = list(get_all_oil_names())
 
         if self.cost_manager:
-            inventory_items = sorted(self.cost_manager.costs.keys())
-            names = sorted(list(set(names + inventory_items)))
+            names = sorted(set(names).union(self.cost_manager.costs))
 
         self.oil_combo.addItems(names)
         self.oil_combo.setCurrentText(current)
@@ -422,10 +421,9 @@ class AdditiveInputWidget(QWidget):
         self.add_combo = QComboBox()
         self.add_combo.setEditable(True)
 
-        additive_names = get_all_additive_names()
+        additive_names = list(get_all_additive_names())
         if self.cost_manager:
-            inventory_items = sorted(self.cost_manager.costs.keys())
-            additive_names = sorted(list(set(additive_names + inventory_items)))
+            additive_names = sorted(set(additive_names).union(self.cost_manager.costs))
 
         self.add_combo.addItems(additive_names)
         self.add_combo.setCurrentIndex(-1)
@@ -521,10 +519,9 @@ class AdditiveInputWidget(QWidget):
     def refresh_additives(self):
         current = self.add_combo.currentText()
         self.add_combo.clear()
-        names = get_all_additive_names()
+        names = list(get_all_additive_names())
         if self.cost_manager:
-            inventory_items = sorted(self.cost_manager.costs.keys())
-            names = sorted(list(set(names + inventory_items)))
+            names = sorted(set(names).union(self.cost_manager.costs))
         self.add_combo.addItems(names)
         self.add_combo.setCurrentText(current)
 
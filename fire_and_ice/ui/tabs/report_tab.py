@@ -3,7 +3,7 @@ from datetime import datetime
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtCore import QUrl
-from src.utils.logger import log
+from fire_and_ice.utils.logger import log
 
 
 class RecipeReportWidget(QWidget):
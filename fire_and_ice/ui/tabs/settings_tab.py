@@ -13,8 +13,8 @@ from PyQt6.QtWidgets import (
     QFormLayout,
     QLineEdit,
 )
-from src.utils.logger import log
-from src.models import SoapCalculator
+from fire_and_ice.utils.logger import log
+from fire_and_ice.models import SoapCalculator
 
 
 
@@ -0,0 +1 @@
+"""Recipe management views"""
@@ -0,0 +1,133 @@
+"""JSON file helpers shared by the on-disk data stores"""
+
+import json
+import os
+
+# Optional fast JSON parser. Only used for loading: orjson's encoder rejects
+# non-str keys and writes NaN/inf as null, so saving stays on the stdlib
+# encoder, which handles everything the stores hold the way they always have.
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def load_json(path: str):
+    """
+    Parse a JSON file.
+
+    The file is read as bytes so the parser consumes it directly instead of
+    going through a text decoding layer first. Files orjson rejects (e.g.
+    ones holding NaN, which the stdlib writes) are parsed by the stdlib.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def encode_json(data, pretty: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, indented unless pretty=False."""
+    if pretty:
+        text = json.dumps(data, indent=2)
+    else:
+        text = json.dumps(data, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def write_atomic(path: str, payload: bytes):
+    """
+    Atomically replace path with payload.
+
+    The bytes are written to a temporary file which then replaces the
+    target, so a failed write never leaves a truncated file behind.
+    Raises OSError if the write fails.
+    """
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        raise
+
+
+def dump_json(path: str, data, pretty: bool = True):
+    """
+    Atomically write data to path as JSON.
+
+    Raises OSError if the write fails.
+    """
+    write_atomic(path, encode_json(data, pretty))
+
+
+# Journaled stores: a JSON object file plus an append-only JSON-lines log of
+# "add"/"remove" edits made since the file was last rewritten. Edits cost one
+# appended line; the file itself is rewritten (compacted) once, e.g. at exit,
+# and a crash in between loses nothing because the log is replayed on load.
+
+
+def journal_path(path: str) -> str:
+    """Return the edit log that belongs to the journaled file at path."""
+    return f"{path}.log"
+
+
+def append_journal(path: str, op: str, name: str, info=None):
+    """
+    Record one edit in path's log.
+
+    op is "add" (name now maps to info) or "remove". Raises OSError if the
+    log can't be written.
+    """
+    entry = {"op": op, "name": name}
+    if op == "add":
+        entry["info"] = info
+    with open(journal_path(path), "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+def replay_journal(path: str, data: dict) -> bool:
+    """
+    Apply the edits logged for path to data, in place.
+
+    Returns True if there was a log to replay (so data now differs from the
+    file and should be compacted). Raises OSError if the log can't be read.
+    """
+    log_path = journal_path(path)
+    if not os.path.exists(log_path):
+        return False
+
+    with open(log_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn final line from an interrupted write
+            if entry.get("op") == "add":
+                data[entry["name"]] = entry["info"]
+            elif entry.get("op") == "remove":
+                data.pop(entry["name"], None)
+    return True
+
+
+def compact_journal(path: str, data: dict):
+    """
+    Write data compactly to path and drop its log.
+
+    Raises OSError if the write fails, in which case the log is kept.
+    """
+    dump_json(path, data, pretty=False)
+    log_path = journal_path(path)
+    if os.path.exists(log_path):
+        os.remove(log_path)
@@ -1,5 +0,0 @@
-"""Data package"""
-
-from .oils import OILS, get_oil_sap, get_all_oil_names, get_oil_info
-
-__all__ = ["OILS", "get_oil_sap", "get_all_oil_names", "get_oil_info"]